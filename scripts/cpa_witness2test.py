@@ -30,6 +30,9 @@ import glob
 import subprocess
 import shutil
 import argparse
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import logging
 import re
@@ -45,16 +48,18 @@ Currently, reachability, overflow and memory safety properties are supported.
 
 __version__ = "0.1"
 
+_LOG = logging.getLogger(__name__)
+
 
 COMPILE_ARGS_FIXED = ["-D__alias__(x)="]
 """List of compiler arguments that are always passed to the compiler."""
 
-# Strings used to match expected error messages
-EXPECTED_ERRMSG_REACH = "cpa_witness2test: violation"
-EXPECTED_ERRMSG_OVERFLOW = "runtime error:"
-EXPECTED_ERRMSG_MEM_FREE = "ERROR: AddressSanitizer: attempting free"
-EXPECTED_ERRMSG_MEM_DEREF = "ERROR: AddressSanitizer:"
-EXPECTED_ERRMSG_MEM_MEMTRACK = "ERROR: AddressSanitizer:"
+# Strings used to match expected error messages in the (undecoded) test output
+EXPECTED_ERRMSG_REACH = b"cpa_witness2test: violation"
+EXPECTED_ERRMSG_OVERFLOW = b"runtime error:"
+EXPECTED_ERRMSG_MEM_FREE = b"ERROR: AddressSanitizer: attempting free"
+EXPECTED_ERRMSG_MEM_DEREF = b"ERROR: AddressSanitizer:"
+EXPECTED_ERRMSG_MEM_MEMTRACK = b"ERROR: AddressSanitizer:"
 
 # Used machine models
 MACHINE_MODEL_32 = "32bit"
@@ -73,6 +78,11 @@ REGEX_MEM_FREE = re.compile(_REGEX_MEM_TEMPLATE % "free")
 REGEX_MEM_DEREF = re.compile(_REGEX_MEM_TEMPLATE % "deref")
 REGEX_MEM_MEMTRACK = re.compile(_REGEX_MEM_TEMPLATE % "memtrack")
 
+# Regular expression used to match the header of a specification file
+_SPEC_HEADER_RE = re.compile("CHECK\(\s*init\(.*\),\s*LTL\(\s*(.+)\s*\)\\r*\\n*")
+# Regular expression used to match the number of a harness file
+_TARGET_NAME_RE = re.compile(r"(\d+)\.harness\.c")
+
 # Names of supported specifications
 SPEC_REACH = "unreach-call"
 SPEC_OVERFLOW = "no-overflow"
@@ -87,6 +97,16 @@ SPECIFICATIONS = {
     SPEC_MEM_DEREF: REGEX_MEM_DEREF,
     SPEC_MEM_MEMTRACK: REGEX_MEM_MEMTRACK,
 }
+# regex group names -> specifications
+_GROUP_TO_SPEC = {spec.replace("-", "_"): spec for spec in SPECIFICATIONS}
+# Regular expression that matches any supported specification,
+# with one named group per specification
+_COMBINED_SPEC_RE = re.compile(
+    "|".join(
+        "(?P<{}>{})".format(group, SPECIFICATIONS[spec].pattern)
+        for group, spec in _GROUP_TO_SPEC.items()
+    )
+)
 
 
 class ValidationError(Exception):
@@ -108,9 +128,9 @@ class ExecutionResult(object):
         the execution.
 
         :param int returncode: Return code of the execution.
-        :param Optional[str] stdout: Output that the execution wrote to stdout,
+        :param Optional[bytes] stdout: Output that the execution wrote to stdout,
                 if any.
-        :param Optionl[str] stderr: Output that the execution wrote to stderr,
+        :param Optional[bytes] stderr: Output that the execution wrote to stderr,
                 if any.
         """
         self._returncode = returncode
@@ -130,17 +150,86 @@ class ExecutionResult(object):
         return self._stderr
 
 
+class ProcessGroup(object):
+    """Group of running subprocesses that can be stopped all at once."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._processes = set()
+        self._stopped = False
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    def add(self, process):
+        """Add the given process to this group.
+        If the group was already stopped, the process is killed right away.
+        """
+        with self._lock:
+            self._processes.add(process)
+            if self._stopped:
+                self._kill(process)
+
+    def discard(self, process):
+        with self._lock:
+            self._processes.discard(process)
+
+    def stop(self):
+        """Kill all processes of this group and all processes added later on."""
+        with self._lock:
+            self._stopped = True
+            for process in self._processes:
+                self._kill(process)
+
+    @staticmethod
+    def _kill(process):
+        try:
+            process.kill()
+        except OSError:
+            pass  # Process has already terminated
+
+
+@functools.lru_cache(maxsize=None)
 def get_cpachecker_version():
     """Return the CPAchecker version used."""
 
     executable = get_cpachecker_executable()
     result = execute([executable, "-help"], quiet=True)
-    for line in result.stdout.split(os.linesep):
+    for line in result.stdout.decode("utf-8", errors="replace").splitlines():
         if line.startswith("CPAchecker"):
             return line.replace("CPAchecker", "").strip()
     return None
 
 
+class _VersionAction(argparse.Action):
+    """Action that prints the CPAchecker version and exits.
+
+    In contrast to argparse's 'version' action, the version is only
+    determined if the option is actually given, because this requires
+    a run of CPAchecker.
+    """
+
+    def __init__(
+        self,
+        option_strings,
+        dest=argparse.SUPPRESS,
+        default=argparse.SUPPRESS,
+        help="show program's version number and exit",
+    ):
+        super(_VersionAction, self).__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(get_cpachecker_version())
+        parser.exit()
+
+
 def create_parser():
     descr = "Validate a given violation witness for an input file."
     if sys.version_info >= (3, 5):
@@ -152,9 +241,7 @@ def create_parser():
 
     parser.add_argument("-help", action="help")
 
-    parser.add_argument(
-        "-version", action="version", version="{}".format(get_cpachecker_version())
-    )
+    parser.add_argument("-version", action=_VersionAction)
 
     machine_model_args = parser.add_mutually_exclusive_group(required=False)
     machine_model_args.add_argument(
@@ -215,9 +302,9 @@ def create_parser():
 
 def _parse_args(argv=sys.argv[1:]):
     parser = create_parser()
-    args = parser.parse_known_args(argv[:-1])[0]
-    args_file = parser.parse_args([argv[-1]])  # Parse the file name
-    args.file = args_file.file
+    # The last argument is always the file to validate. Put it first, so that
+    # it is not swallowed by '-gcc-args', which takes all remaining arguments.
+    args = parser.parse_known_args(argv[-1:] + argv[:-1])[0]
 
     return args
 
@@ -238,58 +325,70 @@ def _create_compiler_cmd_tail(harness, file, target):
     return ["-o", target, "-include", file, harness]
 
 
-def create_compile_cmd(harness, target, args, specification, c_version="gnu11"):
-    """Create the compile command.
+@functools.lru_cache(maxsize=1)
+def _detect_compiler():
+    """Return the compiler to use: clang, if available, and gcc otherwise."""
+    if shutil.which("clang"):
+        return "clang"
+    else:
+        return "gcc"
+
+
+def _create_compile_prefix(args, specification):
+    """Create the part of the compile command that is the same for all harnesses.
 
-    :param str harness: path to harness file
-    :param str target: path to program under test
     :param args: arguments as parsed by argparse
-    :param list specification: list of properties to check against
-    :param str c_version: C standard to use for compilation
-    :return: list of command-line keywords that can be given to method `execute`
+    :param frozenset specification: set of properties to check against
+    :return: list of command-line keywords that start each compile command
     """
 
-    if shutil.which("clang"):
-        compiler = "clang"
-    else:
-        compiler = "gcc"
-
-    compile_cmd = [compiler] + _create_compile_basic_args(args)
-    compile_cmd.append("-std={}".format(c_version))
+    compile_prefix = [_detect_compiler()] + _create_compile_basic_args(args)
 
     sanitizer_in_use = False
     if SPEC_OVERFLOW in specification:
         sanitizer_in_use = True
-        compile_cmd += [
+        compile_prefix += [
             "-fsanitize=signed-integer-overflow",
             "-fsanitize=float-cast-overflow",
         ]
-    if any(
-        spec in specification
-        for spec in (SPEC_MEM_FREE, SPEC_MEM_DEREF, SPEC_MEM_MEMTRACK)
-    ):
+    if specification & {SPEC_MEM_FREE, SPEC_MEM_DEREF, SPEC_MEM_MEMTRACK}:
         sanitizer_in_use = True
-        compile_cmd += ["-fsanitize=address", "-fsanitize=leak"]
+        compile_prefix += ["-fsanitize=address", "-fsanitize=leak"]
 
     if sanitizer_in_use:
         # Do not continue execution after a sanitize error
-        compile_cmd.append("-fno-sanitize-recover")
-    compile_cmd += _create_compiler_cmd_tail(harness, args.file, target)
-    return compile_cmd
+        compile_prefix.append("-fno-sanitize-recover")
+    return compile_prefix
 
 
-def _create_cpachecker_args(args):
-    cpachecker_args = sys.argv[1:]
+def create_compile_cmd(compile_prefix, harness, target, file, c_version="gnu11"):
+    """Create the compile command.
 
-    for compile_arg in ["-gcc-args"] + args.compile_args:
-        if compile_arg in cpachecker_args:
-            cpachecker_args.remove(compile_arg)
+    :param List[str] compile_prefix: start of the compile command,
+        as created by `_create_compile_prefix`
+    :param str harness: path to harness file
+    :param str target: path to program under test
+    :param str file: path to the file to validate the witness for
+    :param str c_version: C standard to use for compilation
+    :return: list of command-line keywords that can be given to method `execute`
+    """
+    return (
+        compile_prefix
+        + ["-std={}".format(c_version)]
+        + _create_compiler_cmd_tail(harness, file, target)
+    )
+
+
+def _create_cpachecker_args(args):
+    removed_args = set(["-gcc-args"] + args.compile_args)
+    cpachecker_args = [arg for arg in sys.argv[1:] if arg not in removed_args]
 
     cpachecker_args.append("-witness2test")
 
     return cpachecker_args
 
 
+@functools.lru_cache(maxsize=None)
 def get_cpachecker_executable():
     """Return the path to the CPAchecker executable 'cpa.sh'.
     If the executable is available in the systeme PATH, this executable is
@@ -311,7 +410,7 @@ def get_cpachecker_executable():
     path_candidates = os.environ["PATH"].split(os.pathsep) + [
         script_dir,
         ".",
-        "." + os.sep + "scripts",
+        os.path.join(".", "scripts"),
     ]
     for path in path_candidates:
         path = path.strip('"')
@@ -330,32 +429,50 @@ def create_harness_gen_cmd(args):
 
 def find_harnesses(output_path):
     """Returns a list of all harness files found in the given directory."""
-    return glob.glob(output_path + "/*harness.c")
+    if sys.version_info < (3, 5):
+        return glob.glob(os.path.join(output_path, "*harness.c"))
+    if not os.path.isdir(output_path):
+        # Harness generation may fail before creating the output directory
+        return []
+    return [
+        entry.path
+        for entry in os.scandir(output_path)
+        if entry.name.endswith("harness.c") and entry.is_file()
+    ]
+
+
+def _get_harness_number(harness_name):
+    return _TARGET_NAME_RE.search(harness_name).group(1)
 
 
 def get_target_name(harness_name):
     """Returns a name for the given harness file name."""
-    harness_number = re.search(r"(\d+)\.harness\.c", harness_name).group(1)
+    harness_number = _get_harness_number(harness_name)
 
     return "test_cex" + harness_number
 
 
-def execute(command, quiet=False):
+def execute(command, quiet=False, process_group=None):
     """Execute the given command.
 
     :param List[str] command: list of words that describe the command line.
     :param Bool quiet: whether to log the executed command line as INFO.
+    :param Optional[ProcessGroup] process_group: group to add the started
+        process to while it is running, if any.
     :return ExecutionResult: result object with information about the execution.
+        Its output is not decoded, but given as bytes.
     """
-    if not quiet:
-        logging.info(" ".join(command))
-    p = subprocess.Popen(
-        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
-    )
-    returncode = p.wait()
-    output = p.stdout.read()
-    err_output = p.stderr.read()
-    return ExecutionResult(returncode, output, err_output)
+    if not quiet and _LOG.isEnabledFor(logging.INFO):
+        _LOG.info("%s", " ".join(command))
+    p = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if process_group is not None:
+        process_group.add(p)
+    try:
+        output, err_output = p.communicate()
+    finally:
+        if process_group is not None:
+            process_group.discard(p)
+    return ExecutionResult(p.returncode, output, err_output)
 
 
 def analyze_result(test_result, harness, specification):
@@ -363,37 +480,34 @@ def analyze_result(test_result, harness, specification):
 
     :param ExecutionResult test_result: result of test execution
     :param str harness: path to harness file
-    :param list specification: list of properties that are part of the specification
+    :param frozenset specification: set of properties that are part of the specification
     :return: tuple of the verdict of the test execution and the violated property, if any.
         The verdict is one of RESULT_ACCEPT, RESULT_REJECT and RESULT_UNK.
         The violated property is one element of the given specification.
     """
-    results_and_violated_props = list()
-
-    def check(code, err_msg, spec_property):
-        results_and_violated_props.append(
-            _analyze_result_values(test_result, harness, code, err_msg, spec_property)
+    seen_unknown = False
+    # For each specification property, check whether an error message
+    # showing its violation was printed.
+    # The first property found to be violated determines the verdict.
+    # TODO: Remove magic numbers
+    for spec_property, code, err_msg in (
+        (SPEC_REACH, 107, EXPECTED_ERRMSG_REACH),
+        (SPEC_OVERFLOW, 1, EXPECTED_ERRMSG_OVERFLOW),
+        (SPEC_MEM_FREE, 1, EXPECTED_ERRMSG_MEM_FREE),
+        (SPEC_MEM_DEREF, 1, EXPECTED_ERRMSG_MEM_DEREF),
+        (SPEC_MEM_MEMTRACK, 1, EXPECTED_ERRMSG_MEM_MEMTRACK),
+    ):
+        if spec_property not in specification:
+            continue
+        result, violated_prop = _analyze_result_values(
+            test_result, harness, code, err_msg, spec_property
         )
+        if result == RESULT_ACCEPT:
+            return RESULT_ACCEPT, violated_prop
+        elif result == RESULT_UNK:
+            seen_unknown = True
 
-    # For each specification property, check whether an error message
-    # showing its violation was printed
-    # TODO: Turn into dict() with loop to be more flexible and remove magic numbers
-    if SPEC_REACH in specification:
-        check(107, EXPECTED_ERRMSG_REACH, SPEC_REACH)
-    if SPEC_OVERFLOW in specification:
-        check(1, EXPECTED_ERRMSG_OVERFLOW, SPEC_OVERFLOW)
-    if SPEC_MEM_FREE in specification:
-        check(1, EXPECTED_ERRMSG_MEM_FREE, SPEC_MEM_FREE)
-    if SPEC_MEM_DEREF in specification:
-        check(1, EXPECTED_ERRMSG_MEM_DEREF, SPEC_MEM_DEREF)
-    if SPEC_MEM_MEMTRACK in specification:
-        check(1, EXPECTED_ERRMSG_MEM_MEMTRACK, SPEC_MEM_MEMTRACK)
-
-    results = [r[0] for r in results_and_violated_props]
-    if RESULT_ACCEPT in results:
-        violated_prop = results_and_violated_props[results.index(RESULT_ACCEPT)][1]
-        return RESULT_ACCEPT, violated_prop
-    elif RESULT_UNK in results:
+    if seen_unknown:
         return RESULT_UNK, None
     else:
         return RESULT_REJECT, None
@@ -407,35 +521,40 @@ def _analyze_result_values(
         and test_result.stderr
         and expected_errmsg in test_result.stderr
     ):
-        logging.info(
-            "Harness {} reached expected property violation ({}).".format(
-                harness, spec_prop
-            )
+        _LOG.info(
+            "Harness %s reached expected property violation (%s).", harness, spec_prop
         )
         return RESULT_ACCEPT, spec_prop
     elif test_result.returncode == 0:
-        logging.info("Harness {} did not encounter _any_ error".format(harness))
+        _LOG.info("Harness %s did not encounter _any_ error", harness)
         return RESULT_REJECT, None
     else:
-        logging.info("Run with harness {} was not successful".format(harness))
+        _LOG.info("Run with harness %s was not successful", harness)
         return RESULT_UNK, None
 
 
-def _log_multiline(msg, level=logging.INFO):
+def _log_multiline(msg, level=logging.INFO, prefix=None):
+    if not _LOG.isEnabledFor(level):
+        return
     if type(msg) is list:
         msg_lines = msg
     else:
-        msg_lines = msg.split("\n")
+        if type(msg) is bytes:
+            msg = msg.decode("utf-8", errors="replace")
+        msg_lines = msg.splitlines()
     for line in msg_lines:
-        logging.log(level, line)
+        if prefix:
+            _LOG.log(level, "%s: %s", prefix, line)
+        else:
+            _LOG.log(level, line)
 
 
 def get_spec(specification_file):
-    """Return the list of specification properties defined by the given
+    """Return the set of specification properties defined by the given
     specification file.
 
     :param str specification_file: specification file to read.
-    :return List[str]: list of specification properties
+    :return FrozenSet[str]: set of specification properties
     :raise ValidationError: if no specification file given or it doesn't exist
     """
 
@@ -450,17 +569,86 @@ def get_spec(specification_file):
         content = inp.read().strip()
 
     specification = list()
-    spec_matches = re.match(
-        "CHECK\(\s*init\(.*\),\s*LTL\(\s*(.+)\s*\)\\r*\\n*", content
-    )
+    spec_matches = _SPEC_HEADER_RE.match(content)
     if spec_matches:
-        for spec, regex in SPECIFICATIONS.items():
-            if regex.search(content):
-                specification.append(spec)
+        for match in _COMBINED_SPEC_RE.finditer(content):
+            specification.append(_GROUP_TO_SPEC[match.lastgroup])
 
     if not specification:
         raise ValidationError("No SV-COMP specification found in " + specification_file)
-    return specification
+    return frozenset(specification)
+
+
+def _process_harness(
+    harness, compile_prefix, args, specification, output_dir, process_group
+):
+    """Compile the given harness together with the program under test,
+    execute the resulting program and analyze its result.
+
+    :param str harness: path to harness file
+    :param List[str] compile_prefix: start of the compile command,
+        as created by `_create_compile_prefix`
+    :param args: arguments as parsed by argparse
+    :param frozenset specification: set of properties to check against
+    :param str output_dir: directory to write the executable and its output to
+    :param ProcessGroup process_group: group to run all processes in.
+        If the group is stopped, the harness is not processed any further.
+    :return: tuple of the harness, the verdict of the test execution,
+        the violated property (if any), whether compilation with C11 was
+        successful and whether compilation was successful at all.
+        If compilation failed, the verdict is None.
+        If processing was stopped through the process group, None is returned.
+    """
+    if process_group.stopped:
+        return None
+    _LOG.info("Looking at %s", harness)
+    exe_target = os.path.join(output_dir, get_target_name(harness))
+    compile_cmd = create_compile_cmd(compile_prefix, harness, exe_target, args.file)
+    compile_result = execute(compile_cmd, process_group=process_group)
+    if process_group.stopped:
+        return None
+
+    _log_multiline(compile_result.stderr, level=logging.INFO, prefix=harness)
+    _log_multiline(compile_result.stdout, level=logging.DEBUG, prefix=harness)
+
+    c11_ok = compile_result.returncode == 0
+    if not c11_ok:
+        compile_cmd = create_compile_cmd(
+            compile_prefix, harness, exe_target, args.file, "gnu90"
+        )
+        compile_result = execute(compile_cmd, process_group=process_group)
+        if process_group.stopped:
+            return None
+        _log_multiline(compile_result.stderr, level=logging.INFO, prefix=harness)
+        _log_multiline(compile_result.stdout, level=logging.DEBUG, prefix=harness)
+
+        if compile_result.returncode != 0:
+            _LOG.warning("Compilation failed for harness %s", harness)
+            return harness, None, None, False, False
+
+    test_result = execute([exe_target], process_group=process_group)
+    if process_group.stopped:
+        return None
+    # Use a separate output file for each harness,
+    # because harnesses are processed concurrently
+    harness_number = _get_harness_number(harness)
+    test_stdout_file = os.path.join(output_dir, "stdout_{}.txt".format(harness_number))
+    test_stderr_file = os.path.join(output_dir, "stderr_{}.txt".format(harness_number))
+    if test_result.stdout:
+        with open(test_stdout_file, "wb") as output:
+            output.write(test_result.stdout)
+            _LOG.info("Wrote stdout of test execution to %s", test_stdout_file)
+    if test_result.stderr:
+        with open(test_stderr_file, "wb") as error_output:
+            error_output.write(test_result.stderr)
+            _LOG.info("Wrote stderr of test execution to %s", test_stderr_file)
+
+    result, violated_property = analyze_result(test_result, harness, specification)
+    if result == RESULT_ACCEPT:
+        # No other harness has to be looked at anymore. Stop right here,
+        # so that this thread doesn't start with the next harness
+        process_group.stop()
+    return harness, result, violated_property, c11_ok, True
 
 
 def run():
@@ -472,77 +660,69 @@ def run():
 
     harness_gen_cmd = create_harness_gen_cmd(args)
     harness_gen_result = execute(harness_gen_cmd)
-    print(harness_gen_result.stderr)
+    print(harness_gen_result.stderr.decode("utf-8", errors="replace"))
     _log_multiline(harness_gen_result.stdout, level=logging.DEBUG)
 
     created_harnesses = find_harnesses(output_dir)
     statistics.append(("Harnesses produced", len(created_harnesses)))
 
+    compile_prefix = _create_compile_prefix(args, specification)
     final_result = None
     violated_property = None
     successful_harness = None
-    iter_count = 0  # Count how many harnesses were tested
-    compile_success_count = 0  # Count how often compilation overall was successful
-    c11_success_count = 0  # Count how often compilation with C11 standard was sucessful
-    reject_count = 0
-    for harness in created_harnesses:
-        iter_count += 1
-        logging.info("Looking at {}".format(harness))
-        exe_target = output_dir + os.sep + get_target_name(harness)
-        compile_cmd = create_compile_cmd(harness, exe_target, args, specification)
-        compile_result = execute(compile_cmd)
-
-        _log_multiline(compile_result.stderr, level=logging.INFO)
-        _log_multiline(compile_result.stdout, level=logging.DEBUG)
-
-        if compile_result.returncode != 0:
-            compile_cmd = create_compile_cmd(
-                harness, exe_target, args, specification, "gnu90"
+    # Harnesses are independent of each other and most of the work happens
+    # in external processes (compiler and test executable), so threads suffice
+    process_group = ProcessGroup()
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    futures = []
+    try:
+        futures = [
+            executor.submit(
+                _process_harness,
+                harness,
+                compile_prefix,
+                args,
+                specification,
+                output_dir,
+                process_group,
             )
-            compile_result = execute(compile_cmd)
-            _log_multiline(compile_result.stderr, level=logging.INFO)
-            _log_multiline(compile_result.stdout, level=logging.DEBUG)
-
-            if compile_result.returncode != 0:
-                logging.warning("Compilation failed for harness {}".format(harness))
-                continue
-
-        else:
-            c11_success_count += 1
-        compile_success_count += 1
-
-        test_result = execute([exe_target])
-        test_stdout_file = output_dir + os.sep + "stdout.txt"
-        test_stderr_file = output_dir + os.sep + "stderr.txt"
-        if test_result.stdout:
-            with open(test_stdout_file, "w+") as output:
-                output.write(test_result.stdout)
-                logging.info(
-                    "Wrote stdout of test execution to {}".format(test_stdout_file)
-                )
-        if test_result.stderr:
-            with open(test_stderr_file, "w+") as error_output:
-                error_output.write(test_result.stderr)
-                logging.info(
-                    "Wrote stderr of test execution to {}".format(test_stderr_file)
-                )
-
-        result, new_violated_property = analyze_result(
-            test_result, harness, specification
-        )
-        if result == RESULT_ACCEPT:
-            successful_harness = harness
-            final_result = RESULT_ACCEPT
-            if not violated_property:  # Use first violated property
-                violated_property = new_violated_property
-            break
-        elif result == RESULT_REJECT:
-            reject_count += 1
-            if not final_result:
-                # Only set final result to 'reject' if no harness produces any error
-                final_result = RESULT_REJECT
-        else:
+            for harness in created_harnesses
+        ]
+        for future in as_completed(futures):
+            outcome = future.result()
+            if outcome and outcome[1] == RESULT_ACCEPT:
+                successful_harness, final_result, violated_property = outcome[:3]
+                break
+    finally:
+        # Stop all harnesses that are still being processed or not started yet,
+        # without waiting for them
+        process_group.stop()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    # Only consider harnesses that were processed completely
+    outcomes = [
+        future.result()
+        for future in futures
+        if future.done()
+        and not future.cancelled()
+        and future.exception() is None
+        and future.result() is not None
+    ]
+    iter_count = len(outcomes)  # Count how many harnesses were tested
+    # Count how often compilation overall was successful
+    compile_success_count = sum(1 for outcome in outcomes if outcome[4])
+    # Count how often compilation with C11 standard was sucessful
+    c11_success_count = sum(1 for outcome in outcomes if outcome[3])
+    results = [outcome[1] for outcome in outcomes if outcome[4]]
+    reject_count = results.count(RESULT_REJECT)
+    if not final_result:
+        if RESULT_UNK in results:
             final_result = RESULT_UNK
+        elif reject_count:
+            # Only set final result to 'reject' if no harness produces any error
+            final_result = RESULT_REJECT
 
     if compile_success_count == 0:
         raise ValidationError("Compilation failed for every harness/file pair.")
@@ -575,5 +755,5 @@ if __name__ == "__main__":
     try:
         run()
     except ValidationError as e:
-        logging.error(e.msg)
+        _LOG.error(e.msg)
         print("Verification result: ERROR.")